@@ -4,20 +4,25 @@ from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 import sys
 
+# Indexed by replica set member state code; 4 is unused
+STATE_NAMES = (
+    "STARTUP",
+    "PRIMARY",
+    "SECONDARY",
+    "RECOVERING",
+    None,
+    "STARTUP2",
+    "UNKNOWN",
+    "ARBITER",
+    "DOWN",
+    "ROLLBACK",
+    "REMOVED"
+)
+
 def get_state_name(state):
-    states = {
-        0: "STARTUP",
-        1: "PRIMARY",
-        2: "SECONDARY",
-        3: "RECOVERING",
-        5: "STARTUP2",
-        6: "UNKNOWN",
-        7: "ARBITER",
-        8: "DOWN",
-        9: "ROLLBACK",
-        10: "REMOVED"
-    }
-    return states.get(state, f"UNKNOWN({state})")
+    if isinstance(state, int) and 0 <= state < len(STATE_NAMES) and STATE_NAMES[state]:
+        return STATE_NAMES[state]
+    return f"UNKNOWN({state})"
 
 def check_replicaset_status():
     try:
@@ -1,13 +1,40 @@
 # init_mongo_servers.py
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pymongo
 import yaml
 import sys
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 CONFIG_FILE = 'mongo_servers.yml'
 
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(uri):
+    # Reuse one client per URI so repeated calls skip topology discovery and auth
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=5000)
+            _clients[uri] = client
+    return client
+
+def close_clients():
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+atexit.register(close_clients)
+
 def load_config(config_file):
     with open(config_file, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 def test_connection(server):
     host = server['host']
@@ -16,13 +43,10 @@ def test_connection(server):
     password = server['password']
     uri = f"mongodb://{user}:{password}@{host}:{port}/admin?directConnection=true"
     try:
-        client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=5000)
-        client.admin.command('ping')
+        get_client(uri).admin.command('ping')
         print(f"Connected to {host}:{port} as {user} successfully.")
     except Exception as e:
         print(f"Error connecting to {host}:{port} as {user}: {e}")
-    finally:
-        client.close()
 
 def init_primary(server):
     host = server['host']
@@ -31,7 +55,7 @@ def init_primary(server):
     password = server['password']
     uri = f"mongodb://{user}:{password}@{host}:{port}/admin?directConnection=true"
     try:
-        client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=5000)
+        client = get_client(uri)
         rs_config = {
             '_id': 'rs0',
             'members': [
@@ -48,13 +72,12 @@ def init_primary(server):
     except Exception as e:
         print(f"Error connecting to {host}:{port} as {user}: {e}")
         exit(1)
-    finally:
-        client.close()
 
 def main():
     config = load_config(CONFIG_FILE)
-    for idx, server in enumerate(config['servers']):
-        test_connection(server)
+    # Ping all members at once so a slow node doesn't delay the others
+    with ThreadPoolExecutor(max_workers=len(config['servers'])) as executor:
+        list(executor.map(test_connection, config['servers']))
     init_primary(config['servers'][0])
 
 if __name__ == '__main__':